@@ -1,345 +1,451 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import altair as alt
-
-
-
-# ======================================
-# 1. 模型參數（依照你提供的數據計算）
-# ======================================
-
-# 台灣自然路徑（1997–2024 平均）
-TW_GDP_CAGR_BASE   = 0.03642405889760747   # 約 3.64% / 年
-TW_FDI_CAGR_BASE   = 0.022877126440026485  # 約 2.29% / 年
-TW_HOUSE_CAGR_BASE = 0.0409105229702702    # 約 4.09% / 年（2012–2021）
-
-# 套用「香港回歸衝擊係數」後（中國模式）
-TW_GDP_CAGR_CHINA   = 0.010086986828831218  # 約 1.01% / 年
-TW_FDI_CAGR_CHINA   = 0.011270998331796981  # 約 1.13% / 年
-TW_HOUSE_CAGR_CHINA = 0.007923277505180824  # 約 0.79% / 年
-
-# 台灣 2024 年基準值（從台灣資料.xlsx 算出來）
-BASE_GDP_2024 = 796_904_000_000     # USD
-BASE_FDI_2024 = 7_858_117_000       # USD
-
-BASE_YEAR = 2024
-END_YEAR  = 2029
-
-
-# ======================================
-# 2. 預測運算函式
-# ======================================
-
-def project(base_value, cagr, years):
-    """複利成長：base_value * (1+cagr)^years"""
-    return base_value * ((1 + cagr) ** years)
-
-
-def build_macro():
-    """建立 2024–2029 台灣 GDP / FDI 兩種情境預測（單位：千萬美元）"""
-    years = np.arange(BASE_YEAR, END_YEAR + 1)
-    t = years - BASE_YEAR
-
-    gdp_nat_usd   = project(BASE_GDP_2024, TW_GDP_CAGR_BASE, t)
-    gdp_china_usd = project(BASE_GDP_2024, TW_GDP_CAGR_CHINA, t)
-    fdi_nat_usd   = project(BASE_FDI_2024, TW_FDI_CAGR_BASE, t)
-    fdi_china_usd = project(BASE_FDI_2024, TW_FDI_CAGR_CHINA, t)
-
-    df = pd.DataFrame({
-        "年份": years,
-        "自然_GDP_美元": gdp_nat_usd,
-        "中國模式_GDP_美元": gdp_china_usd,
-        "自然_FDI_美元": fdi_nat_usd,
-        "中國模式_FDI_美元": fdi_china_usd,
-    })
-
-    # 轉成「千萬美元」
-    df["自然_GDP_千萬美元"]     = df["自然_GDP_美元"] / 10_000_000
-    df["中國模式_GDP_千萬美元"] = df["中國模式_GDP_美元"] / 10_000_000
-    df["自然_FDI_千萬美元"]     = df["自然_FDI_美元"] / 10_000_000
-    df["中國模式_FDI_千萬美元"] = df["中國模式_FDI_美元"] / 10_000_000
-
-    return df
-
-
-def build_personal(income_2024_ntd, house_2024_ntd):
-    """建立個人 2024–2029 收入 / 房價 / 房價所得比兩種情境"""
-    years = np.arange(BASE_YEAR, END_YEAR + 1)
-    t = years - BASE_YEAR
-
-    income_nat   = project(income_2024_ntd, TW_GDP_CAGR_BASE, t)
-    income_china = project(income_2024_ntd, TW_GDP_CAGR_CHINA, t)
-    house_nat    = project(house_2024_ntd, TW_HOUSE_CAGR_BASE, t)
-    house_china  = project(house_2024_ntd, TW_HOUSE_CAGR_CHINA, t)
-
-    df = pd.DataFrame({
-        "年份": years,
-        "自然_收入_新台幣": income_nat,
-        "中國模式_收入_新台幣": income_china,
-        "自然_房價_新台幣": house_nat,
-        "中國模式_房價_新台幣": house_china,
-    })
-
-    # 房價所得比（倍數）
-    df["自然_房價所得比"]   = df["自然_房價_新台幣"] / df["自然_收入_新台幣"]
-    df["中國模式_房價所得比"] = df["中國模式_房價_新台幣"] / df["中國模式_收入_新台幣"]
-
-    # 顯示友善：四捨五入
-    df["自然_收入_新台幣"]     = df["自然_收入_新台幣"].round(0)
-    df["中國模式_收入_新台幣"] = df["中國模式_收入_新台幣"].round(0)
-    df["自然_房價_新台幣"]     = df["自然_房價_新台幣"].round(0)
-    df["中國模式_房價_新台幣"] = df["中國模式_房價_新台幣"].round(0)
-    df["自然_房價所得比"]     = df["自然_房價所得比"].round(2)
-    df["中國模式_房價所得比"] = df["中國模式_房價所得比"].round(2)
-
-    return df
-
-
-# ======================================
-# 3. 折線圖
-# ======================================
-
-def line_chart(df, x_col, y_cols, title, unit=""):
-    df2 = df.copy()
-    df2[x_col] = df2[x_col].astype(str)
-
-    melt_df = df2.melt(x_col, y_cols, var_name="指標", value_name="數值")
-
-    chart = (
-        alt.Chart(melt_df)
-        .mark_line(point=alt.OverlayMarkDef(size=80), strokeWidth=4)
-        .encode(
-            x=alt.X(
-                f"{x_col}:O",
-                title="年份",
-                axis=alt.Axis(
-                    labelAngle=0,
-                    labelColor="black",
-                    titleColor="black"
-                )
-            ),
-            y=alt.Y(
-                "數值:Q",
-                title=f"數值（{unit}）" if unit else "數值",
-                axis=alt.Axis(
-                    labelColor="black",
-                    titleColor="black"
-                )
-            ),
-            color=alt.Color(
-                "指標:N",
-                title="情境 / 指標",
-                scale=alt.Scale(
-                    range=[
-                        "#FF3B30",
-                        "#009DFF",
-                        "#FFC300",
-                        "#FF6F00"
-                    ]
-                ),
-                legend=alt.Legend(labelColor="black", titleColor="black")
-            ),
-            tooltip=[
-                alt.Tooltip(f"{x_col}:O", title="年份"),
-                alt.Tooltip("指標:N", title="情境 / 指標"),
-                alt.Tooltip("數值:Q", format=",.0f", title="數值")
-            ]
-        )
-        .properties(
-            title=alt.TitleParams(
-                text=title,
-                color="black"
-            ),
-            width=780,
-            height=360,
-            background="#FFFFFF"
-        )
-    )
-
-    st.altair_chart(chart, use_container_width=True)
-
-
-
-# ======================================
-# 4. Streamlit 主畫面 UI
-# ======================================
-
-st.set_page_config(
-    page_title="台灣 2024–2029 經濟互動預測",
-    layout="wide"
-    # dark theme 可在 .streamlit/config.toml 裡設定 theme="dark"
-)
-
-st.title("🇹🇼 台灣 2024–2029 經濟互動預測模型")
-st.caption("情境比較：自然發展 vs. 中國模式（香港回歸衝擊係數）")
-
-st.markdown("""
-本互動模型使用：
-
-- **台灣 1997–2024 歷史 GDP / 外資 / 房價成長率**
-- **香港回歸前後的成長率變化 → 推出「中國模式衝擊係數」**
-
-來模擬台灣在 **2024–2029**：
-
-- 若維持自然發展（不受中國影響）
-- 若遭遇類似香港回歸後的制度衝擊（中國模式）
-
-對 **GDP、外資 FDI、個人收入、房價、房價所得比** 的可能路徑。
-""")
-
-
-# --------------------------------------
-# 左側：個人參數輸入
-# --------------------------------------
-
-st.sidebar.header("🔧 你的個人數據（2024 年起點）")
-
-income_2024 = st.sidebar.number_input(
-    "你的年收入（新台幣）",
-    min_value=0.0,
-    value=1_000_000.0,
-    step=50_000.0,
-    format="%.0f"
-)
-
-house_2024 = st.sidebar.number_input(
-    "你目前房屋市值（新台幣）",
-    min_value=0.0,
-    value=10_000_000.0,
-    step=100_000.0,
-    format="%.0f"
-)
-
-st.sidebar.markdown("---")
-st.sidebar.write("📘 **模型內部假設（已由資料計算）**")
-st.sidebar.write(f"- 台灣自然 GDP 成長率：約 **{TW_GDP_CAGR_BASE*100:.2f}% / 年**")
-st.sidebar.write(f"- 中國模式 GDP 成長率：約 **{TW_GDP_CAGR_CHINA*100:.2f}% / 年**")
-st.sidebar.write(f"- 台灣自然房價成長率：約 **{TW_HOUSE_CAGR_BASE*100:.2f}% / 年**")
-st.sidebar.write(f"- 中國模式房價成長率：約 **{TW_HOUSE_CAGR_CHINA*100:.2f}% / 年**")
-
-
-# ======================================
-# 5. 建立預測資料
-# ======================================
-
-macro_df = build_macro()
-personal_df = build_personal(income_2024, house_2024)
-
-# 方便顯示：四捨五入
-macro_df_round = macro_df.copy()
-for col in ["自然_GDP_千萬美元", "中國模式_GDP_千萬美元",
-            "自然_FDI_千萬美元", "中國模式_FDI_千萬美元"]:
-    macro_df_round[col] = macro_df_round[col].round(0).astype(int)
-
-personal_df_round = personal_df.copy()
-for col in [
-    "自然_收入_新台幣", "中國模式_收入_新台幣",
-    "自然_房價_新台幣", "中國模式_房價_新台幣"
-]:
-    personal_df_round[col] = personal_df_round[col].round(0)
-
-for col in ["自然_房價所得比", "中國模式_房價所得比"]:
-    personal_df_round[col] = personal_df_round[col].round(2)
-
-
-# ======================================
-# 6. 顯示：國家層級 GDP / FDI 預測
-# ======================================
-
-st.subheader("📈 國家層級：台灣 GDP 與外資 FDI 預測（單位：千萬美元）")
-
-# GDP 圖
-line_chart(
-    macro_df_round,
-    x_col="年份",
-    y_cols=["自然_GDP_千萬美元", "中國模式_GDP_千萬美元"],
-    title="台灣 GDP 預測（千萬美元）",
-    unit="千萬美元"
-)
-
-# FDI 圖
-line_chart(
-    macro_df_round,
-    x_col="年份",
-    y_cols=["自然_FDI_千萬美元", "中國模式_FDI_千萬美元"],
-    title="台灣外資 FDI 預測（千萬美元）",
-    unit="千萬美元"
-)
-
-st.markdown("**GDP / FDI 詳細數值（千萬美元）**")
-macro_df_show = macro_df_round[[
-    "年份",
-    "自然_GDP_千萬美元", "中國模式_GDP_千萬美元",
-    "自然_FDI_千萬美元", "中國模式_FDI_千萬美元"
-]].reset_index(drop=True)
-
-st.dataframe(macro_df_show, use_container_width=True)
-
-
-
-# ======================================
-# 7. 個人收入預測（新台幣原值）
-# ======================================
-
-st.subheader("👤 你的個人收入：在兩種情境下的變化（單位：新台幣）")
-
-line_chart(
-    personal_df_round,
-    x_col="年份",
-    y_cols=["自然_收入_新台幣", "中國模式_收入_新台幣"],
-    title="你的收入預測（新台幣）",
-    unit="新台幣"
-)
-
-st.dataframe(
-    personal_df_round[["年份", "自然_收入_新台幣", "中國模式_收入_新台幣"]],
-    use_container_width=True
-)
-
-
-# ======================================
-# 8. 個人房價預測（新台幣原值）
-# ======================================
-
-st.subheader("🏠 你的房價：在兩種情境下的變化（單位：新台幣）")
-
-line_chart(
-    personal_df_round,
-    x_col="年份",
-    y_cols=["自然_房價_新台幣", "中國模式_房價_新台幣"],
-    title="你的房價預測（新台幣）",
-    unit="新台幣"
-)
-
-st.dataframe(
-    personal_df_round[["年份", "自然_房價_新台幣", "中國模式_房價_新台幣"]],
-    use_container_width=True
-)
-
-
-# ======================================
-# 9. 房價負擔能力：房價所得比
-# ======================================
-
-st.subheader("💰 房價負擔能力：房價所得比變化（房價 ÷ 年收入，倍數）")
-
-line_chart(
-    personal_df_round,
-    x_col="年份",
-    y_cols=["自然_房價所得比", "中國模式_房價所得比"],
-    title="房價所得比（倍數）",
-    unit="倍"
-)
-
-st.dataframe(
-    personal_df_round[["年份", "自然_房價所得比", "中國模式_房價所得比"]],
-    use_container_width=True
-)
-
-st.markdown("""
-> 🔎 說明：房價所得比 = 房價 ÷ 年收入  
-> - 例如：房價 1,000 萬、年收入 100 萬 → 房價所得比 = 10 倍  
-> - 數字越高，代表買房壓力越大。
-""")
-
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # 沒裝 numba 時退回純 NumPy 路徑
+    njit = None
+
+
+
+# ======================================
+# 1. 模型參數（依照你提供的數據計算）
+# ======================================
+
+# 台灣自然路徑（1997–2024 平均）
+TW_GDP_CAGR_BASE   = 0.03642405889760747   # 約 3.64% / 年
+TW_FDI_CAGR_BASE   = 0.022877126440026485  # 約 2.29% / 年
+TW_HOUSE_CAGR_BASE = 0.0409105229702702    # 約 4.09% / 年（2012–2021）
+
+# 套用「香港回歸衝擊係數」後（中國模式）
+TW_GDP_CAGR_CHINA   = 0.010086986828831218  # 約 1.01% / 年
+TW_FDI_CAGR_CHINA   = 0.011270998331796981  # 約 1.13% / 年
+TW_HOUSE_CAGR_CHINA = 0.007923277505180824  # 約 0.79% / 年
+
+# 台灣 2024 年基準值（從台灣資料.xlsx 算出來）
+BASE_GDP_2024 = 796_904_000_000     # USD
+BASE_FDI_2024 = 7_858_117_000       # USD
+
+BASE_YEAR = 2024
+END_YEAR  = 2029
+
+# 預測的年份軸與起算年數：常數就先算好，
+# 每次 rerun 不再 arange / 相減（唯讀避免被誤改）
+_YEARS = np.arange(BASE_YEAR, END_YEAR + 1)
+_YEARS.setflags(write=False)
+_T = _YEARS - BASE_YEAR
+_T.setflags(write=False)
+
+
+# ======================================
+# 2. 預測運算函式
+# ======================================
+
+if njit is not None:
+    @njit("float64[:,:](float64[:], float64[:], int64)",
+          parallel=True, cache=True, fastmath=True)
+    def _project_kernel(bases, cagrs, n):
+        out = np.empty((bases.size, n))
+        for k in prange(bases.size):
+            b = bases[k]
+            r = 1.0 + cagrs[k]
+            f = 1.0
+            for j in range(n):
+                out[k, j] = b * f
+                f *= r
+        return out
+else:
+    _project_kernel = None
+
+
+def project(bases, cagrs, t):
+    """複利成長（向量化）：bases[k] * (1+cagrs[k])^t
+
+    一次算完 K 條路徑，回傳 (K, len(t)) 矩陣。
+    t 是從 0 起算的連續年數，因此乘冪可以用逐年累乘
+    （cumprod）取代 pow()，只剩純乘法。
+
+    有 numba 時走固定簽名的編譯核心（cache=True，
+    重啟也不必重新編譯）；沒有就退回 NumPy cumprod。
+    """
+    bases = np.asarray(bases, dtype=np.float64)
+    cagrs = np.asarray(cagrs, dtype=np.float64)
+
+    if _project_kernel is not None:
+        return _project_kernel(bases, cagrs, t.size)
+
+    factors = np.ones((cagrs.size, t.size))
+    factors[:, 1:] = (1.0 + cagrs)[:, None]
+    np.cumprod(factors, axis=1, out=factors)
+
+    return bases[:, None] * factors
+
+
+@st.cache_data
+def build_macro():
+    """建立 2024–2029 台灣 GDP / FDI 兩種情境預測（單位：千萬美元）
+
+    沒有任何輸入、只依賴模組常數，用 st.cache_data 快取後
+    每次 rerun 直接取回同一份結果，不再重算。
+
+    回傳 dict[str, np.ndarray]：6 列的小表用 pandas 來裝
+    反而比算術本身貴，顯示時才在 st.dataframe 前組 DataFrame。
+    顯示值都是整數「千萬美元」，直接存 int64，
+    省去 float64 繞一圈再取整的動作。
+    """
+    vals = project(
+        [BASE_GDP_2024, BASE_GDP_2024, BASE_FDI_2024, BASE_FDI_2024],
+        [TW_GDP_CAGR_BASE, TW_GDP_CAGR_CHINA,
+         TW_FDI_CAGR_BASE, TW_FDI_CAGR_CHINA],
+        _T
+    )
+
+    # 轉成「千萬美元」整數
+    vals /= 10_000_000
+    np.rint(vals, out=vals)
+    vals = vals.astype(np.int64)
+
+    return {
+        "年份": _YEARS,
+        "自然_GDP_千萬美元": vals[0],
+        "中國模式_GDP_千萬美元": vals[1],
+        "自然_FDI_千萬美元": vals[2],
+        "中國模式_FDI_千萬美元": vals[3],
+    }
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def build_personal(income_2024_ntd, house_2024_ntd):
+    """建立個人 2024–2029 收入 / 房價 / 房價所得比兩種情境
+
+    以兩個輸入值當快取 key，使用者調回同一組數字時直接取回結果；
+    max_entries 限制快取筆數，避免長時間互動後無限成長。
+
+    與 build_macro 相同，回傳 dict[str, np.ndarray]，
+    顯示時才組 DataFrame。
+    """
+    vals = project(
+        [income_2024_ntd, income_2024_ntd, house_2024_ntd, house_2024_ntd],
+        [TW_GDP_CAGR_BASE, TW_GDP_CAGR_CHINA,
+         TW_HOUSE_CAGR_BASE, TW_HOUSE_CAGR_CHINA],
+        _T
+    )
+
+    # 房價所得比（倍數）用未取整的值算，之後各自一次 round 全矩陣；
+    # 金額取整後存 int64，所得比顯示到小數兩位、float32 就夠
+    ratios = np.stack((vals[2] / vals[0], vals[3] / vals[1]))
+    np.round(ratios, 2, out=ratios)
+    ratios = ratios.astype(np.float32)
+    np.rint(vals, out=vals)
+    vals = vals.astype(np.int64)
+
+    return {
+        "年份": _YEARS,
+        "自然_收入_新台幣": vals[0],
+        "中國模式_收入_新台幣": vals[1],
+        "自然_房價_新台幣": vals[2],
+        "中國模式_房價_新台幣": vals[3],
+        "自然_房價所得比": ratios[0],
+        "中國模式_房價所得比": ratios[1],
+    }
+
+
+# ======================================
+# 3. 折線圖
+# ======================================
+
+def _records(data, cols):
+    """dict-of-arrays → 可雜湊的資料列 tuple（當快取 key 用）
+
+    每個資料表轉一次、所有圖共用，取代逐張圖各轉一份。
+    """
+    return tuple(zip(*(data[c] for c in cols)))
+
+
+def _fold_chart(x_col, y_cols, title, unit):
+    """單張折線圖的 spec 片段（資料放在外層，由 fold 取欄）"""
+    return {
+        "transform": [{"fold": list(y_cols), "as": ["指標", "數值"]}],
+        "mark": {"type": "line", "point": {"size": 80}, "strokeWidth": 4},
+        "encoding": {
+            "x": {
+                "field": x_col,
+                "type": "ordinal",
+                "title": "年份",
+                "axis": {
+                    "labelAngle": 0,
+                    "labelColor": "black",
+                    "titleColor": "black"
+                }
+            },
+            "y": {
+                "field": "數值",
+                "type": "quantitative",
+                "title": f"數值（{unit}）" if unit else "數值",
+                "axis": {
+                    "labelColor": "black",
+                    "titleColor": "black"
+                }
+            },
+            "color": {
+                "field": "指標",
+                "type": "nominal",
+                "title": "情境 / 指標",
+                "scale": {
+                    "range": [
+                        "#FF3B30",
+                        "#009DFF",
+                        "#FFC300",
+                        "#FF6F00"
+                    ]
+                },
+                "legend": {"labelColor": "black", "titleColor": "black"}
+            },
+            "tooltip": [
+                {"field": x_col, "type": "ordinal", "title": "年份"},
+                {"field": "指標", "type": "nominal", "title": "情境 / 指標"},
+                {"field": "數值", "type": "quantitative",
+                 "format": ",.0f", "title": "數值"}
+            ]
+        },
+        "width": 780,
+        "height": 360,
+        "title": {"text": title, "color": "black"}
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _vega_spec(records, columns, x_col, charts):
+    """把同一份資料的多張折線圖合成單一 Vega-Lite v5 spec（dict）
+
+    直接手寫 spec、跳過 Altair 的物件層與 schemapi 驗證，
+    快取後同一份資料每次 rerun 只剩 dict 查表。
+    長表轉換交給 Vega 端的 fold transform。
+
+    charts 是 (y_cols, title, unit) 的 tuple：多張圖用 vconcat
+    共用最外層的 data，每個 rerun 只內嵌、序列化一份資料；
+    單張圖就攤平成一般 spec，而且只內嵌它實際畫的欄位。
+    """
+    used = [x_col]
+    for y_cols, _, _ in charts:
+        used += [c for c in y_cols if c not in used]
+
+    df2 = pd.DataFrame.from_records(records, columns=list(columns))[used]
+    df2[x_col] = df2[x_col].astype(str)
+
+    spec = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "data": {"values": df2.to_dict("records")},
+        "background": "#FFFFFF"
+    }
+
+    subcharts = [_fold_chart(x_col, y_cols, title, unit)
+                 for y_cols, title, unit in charts]
+    if len(subcharts) == 1:
+        spec.update(subcharts[0])
+    else:
+        spec["vconcat"] = subcharts
+
+    return spec
+
+
+def line_chart(records, columns, x_col, y_cols, title, unit=""):
+    line_charts(records, columns, x_col, ((tuple(y_cols), title, unit),))
+
+
+def line_charts(records, columns, x_col, charts):
+    spec = _vega_spec(records, tuple(columns), x_col, tuple(charts))
+    st.vega_lite_chart(spec, use_container_width=True)
+
+
+
+# ======================================
+# 4. Streamlit 主畫面 UI
+# ======================================
+
+st.set_page_config(
+    page_title="台灣 2024–2029 經濟互動預測",
+    layout="wide"
+    # dark theme 可在 .streamlit/config.toml 裡設定 theme="dark"
+)
+
+st.title("🇹🇼 台灣 2024–2029 經濟互動預測模型")
+st.caption("情境比較：自然發展 vs. 中國模式（香港回歸衝擊係數）")
+
+st.markdown("""
+本互動模型使用：
+
+- **台灣 1997–2024 歷史 GDP / 外資 / 房價成長率**
+- **香港回歸前後的成長率變化 → 推出「中國模式衝擊係數」**
+
+來模擬台灣在 **2024–2029**：
+
+- 若維持自然發展（不受中國影響）
+- 若遭遇類似香港回歸後的制度衝擊（中國模式）
+
+對 **GDP、外資 FDI、個人收入、房價、房價所得比** 的可能路徑。
+""")
+
+
+# --------------------------------------
+# 左側：個人參數輸入
+# --------------------------------------
+
+st.sidebar.header("🔧 你的個人數據（2024 年起點）")
+
+# 輸入欄位由 _personal_block（fragment）寫入這個容器，
+# 先在這裡建立佔位，側欄版面順序才不會變。
+_personal_inputs_box = st.sidebar.container()
+
+st.sidebar.markdown("---")
+st.sidebar.write("📘 **模型內部假設（已由資料計算）**")
+st.sidebar.write(f"- 台灣自然 GDP 成長率：約 **{TW_GDP_CAGR_BASE*100:.2f}% / 年**")
+st.sidebar.write(f"- 中國模式 GDP 成長率：約 **{TW_GDP_CAGR_CHINA*100:.2f}% / 年**")
+st.sidebar.write(f"- 台灣自然房價成長率：約 **{TW_HOUSE_CAGR_BASE*100:.2f}% / 年**")
+st.sidebar.write(f"- 中國模式房價成長率：約 **{TW_HOUSE_CAGR_CHINA*100:.2f}% / 年**")
+
+
+# ======================================
+# 5. 建立預測資料
+# ======================================
+
+# 千萬美元整數、個人欄位的四捨五入都已在 build_* 內完成
+macro = build_macro()
+
+
+# ======================================
+# 6. 顯示：國家層級 GDP / FDI 預測
+# ======================================
+
+st.subheader("📈 國家層級：台灣 GDP 與外資 FDI 預測（單位：千萬美元）")
+
+# 兩張圖共用同一份資料列
+_macro_cols = ["年份",
+               "自然_GDP_千萬美元", "中國模式_GDP_千萬美元",
+               "自然_FDI_千萬美元", "中國模式_FDI_千萬美元"]
+macro_records = _records(macro, _macro_cols)
+
+# GDP / FDI 兩張圖合成一個 vconcat spec，資料只內嵌一份
+line_charts(
+    macro_records,
+    _macro_cols,
+    x_col="年份",
+    charts=(
+        (("自然_GDP_千萬美元", "中國模式_GDP_千萬美元"),
+         "台灣 GDP 預測（千萬美元）", "千萬美元"),
+        (("自然_FDI_千萬美元", "中國模式_FDI_千萬美元"),
+         "台灣外資 FDI 預測（千萬美元）", "千萬美元"),
+    )
+)
+
+st.markdown("**GDP / FDI 詳細數值（千萬美元）**")
+# 6 列靜態小表用 st.table：純 HTML 輸出，免去 st.dataframe
+# 的 Arrow 序列化與互動格線
+st.table(pd.DataFrame(macro).set_index("年份"))
+
+
+
+# ======================================
+# 7–9. 個人區塊：收入 / 房價 / 房價所得比
+# ======================================
+
+@st.fragment
+def _personal_block():
+    """個人輸入與三張個人圖表（fragment）
+
+    收入 / 房價輸入與依賴它們的區塊包在同一個 fragment 裡，
+    調整輸入時只重跑這個子樹，上方的國家層級區塊不重繪。
+    """
+    with _personal_inputs_box:
+        income_2024 = st.number_input(
+            "你的年收入（新台幣）",
+            min_value=0.0,
+            value=1_000_000.0,
+            step=50_000.0,
+            format="%.0f"
+        )
+
+        house_2024 = st.number_input(
+            "你目前房屋市值（新台幣）",
+            min_value=0.0,
+            value=10_000_000.0,
+            step=100_000.0,
+            format="%.0f"
+        )
+
+    personal = build_personal(income_2024, house_2024)
+
+    # 三張圖共用同一份資料列
+    personal_cols = ["年份",
+                     "自然_收入_新台幣", "中國模式_收入_新台幣",
+                     "自然_房價_新台幣", "中國模式_房價_新台幣",
+                     "自然_房價所得比", "中國模式_房價所得比"]
+    personal_records = _records(personal, personal_cols)
+
+    # --- 7. 個人收入預測（新台幣原值） ---
+
+    st.subheader("👤 你的個人收入：在兩種情境下的變化（單位：新台幣）")
+
+    line_chart(
+        personal_records,
+        personal_cols,
+        x_col="年份",
+        y_cols=["自然_收入_新台幣", "中國模式_收入_新台幣"],
+        title="你的收入預測（新台幣）",
+        unit="新台幣"
+    )
+
+    st.table(
+        pd.DataFrame({c: personal[c] for c in
+                      ["年份", "自然_收入_新台幣", "中國模式_收入_新台幣"]}
+                     ).set_index("年份")
+    )
+
+    # --- 8. 個人房價預測（新台幣原值） ---
+
+    st.subheader("🏠 你的房價：在兩種情境下的變化（單位：新台幣）")
+
+    line_chart(
+        personal_records,
+        personal_cols,
+        x_col="年份",
+        y_cols=["自然_房價_新台幣", "中國模式_房價_新台幣"],
+        title="你的房價預測（新台幣）",
+        unit="新台幣"
+    )
+
+    st.table(
+        pd.DataFrame({c: personal[c] for c in
+                      ["年份", "自然_房價_新台幣", "中國模式_房價_新台幣"]}
+                     ).set_index("年份")
+    )
+
+    # --- 9. 房價負擔能力：房價所得比 ---
+
+    st.subheader("💰 房價負擔能力：房價所得比變化（房價 ÷ 年收入，倍數）")
+
+    line_chart(
+        personal_records,
+        personal_cols,
+        x_col="年份",
+        y_cols=["自然_房價所得比", "中國模式_房價所得比"],
+        title="房價所得比（倍數）",
+        unit="倍"
+    )
+
+    st.table(
+        pd.DataFrame({c: personal[c] for c in
+                      ["年份", "自然_房價所得比", "中國模式_房價所得比"]}
+                     ).set_index("年份")
+    )
+
+    st.markdown("""
+> 🔎 說明：房價所得比 = 房價 ÷ 年收入  
+> - 例如：房價 1,000 萬、年收入 100 萬 → 房價所得比 = 10 倍  
+> - 數字越高，代表買房壓力越大。
+""")
+
+
+_personal_block()
+